@@ -1,9 +1,16 @@
 from __future__ import absolute_import, unicode_literals
 
+import threading
+from collections import OrderedDict
+
 import requests
+import six
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 from .auth import BearerAuthentication
-from .compat import JSONDecodeError
+from .compat import (DefaultCookiePolicy, JSONDecodeError, json_dumps,
+                     json_loads)
 from .exceptions import JsonApiException
 from .resources import Resource
 
@@ -32,13 +39,50 @@ class JsonApi(object):
             >>> @_api.register
             ... class Foo(jsonapi.Resource):
             ...     TYPE = "foos"
+
+        When fetching single resources (`Resource.get(id)`, `.reload()`),
+        the bodies of the last CONDITIONAL_CACHE_SIZE responses that came with
+        an 'ETag' or 'Last-Modified' header are kept, so that repeating these
+        requests can be made conditional; if the server responds with
+        '304 Not Modified', the kept body is used. Set to 0 to disable.
     """
 
+    CONDITIONAL_CACHE_SIZE = 128
+
     def __init__(self, **kwargs):
         self.registry = {}
         self.headers = {}
         self.setup(**kwargs)
 
+        # (URL, headers) -> (etag, last_modified, content), least recently
+        # used first; also accessed by the executor's threads
+        self._conditional_cache = OrderedDict()
+        self._conditional_cache_lock = threading.Lock()
+
+        # Reuse connections (and TLS sessions) across requests; idempotent
+        # requests are retried on connection errors, rate limiting (honoring
+        # 'Retry-After') and gateway errors
+        self.session = requests.Session()
+        # Authentication is handled by the headers; don't let cookies from
+        # earlier responses (maybe for other credentials) stick around
+        self.session.cookies.set_policy(
+            DefaultCookiePolicy(allowed_domains=[]),
+        )
+        adapter = HTTPAdapter(pool_maxsize=32,
+                              max_retries=Retry(total=3,
+                                                backoff_factor=0.2,
+                                                status_forcelist=[429, 502,
+                                                                  503, 504],
+                                                raise_on_status=False))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Used for types that haven't been registered; created once here
+        # instead of on every `new()` call
+        class UnregisteredResource(Resource):
+            API = self
+        self._unregistered_class = UnregisteredResource
+
     def setup(self, host=None, auth=None, headers=None):
         if host is not None:
             self.host = host
@@ -62,6 +106,11 @@ class JsonApi(object):
     def request(self, method, url,
                 # Not passed to requests, used to determine Content-Type
                 bulk=False,
+                # Not passed to requests, whether to make a GET conditional
+                # on a kept response (see CONDITIONAL_CACHE_SIZE)
+                conditional=False,
+                # Serialized here, sent as the request body
+                json=None,
                 # Forwarded to requests
                 headers=None, data=None, files=None,
                 allow_redirects=False,
@@ -86,24 +135,72 @@ class JsonApi(object):
         if content_type is not None:
             actual_headers.setdefault('Content-Type', content_type)
 
-        response = requests.request(method, url, headers=actual_headers,
-                                    data=data, files=files,
-                                    allow_redirects=allow_redirects,
-                                    **kwargs)
+        if json is not None:
+            data = json_dumps(json)
+
+        cache_key = cached = None
+        if (conditional and self.CONDITIONAL_CACHE_SIZE and
+                method.lower() == 'get' and (data, files) == (None, None)):
+            prepared = requests.PreparedRequest()
+            prepared.prepare_url(url, kwargs.get('params'))
+            # The headers are part of the key so that a body fetched with
+            # one set of credentials is never served to another
+            cache_key = (prepared.url, tuple(sorted(actual_headers.items())))
+            with self._conditional_cache_lock:
+                cached = self._conditional_cache.get(cache_key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag is not None:
+                    actual_headers.setdefault('If-None-Match', etag)
+                if last_modified is not None:
+                    actual_headers.setdefault('If-Modified-Since',
+                                              last_modified)
+
+        response = self.session.request(method, url, headers=actual_headers,
+                                        data=data, files=files,
+                                        allow_redirects=allow_redirects,
+                                        **kwargs)
 
         if not response.ok:
             try:
                 exc = JsonApiException(response.status_code,
-                                       response.json()['errors'])
+                                       json_loads(response.content)['errors'])
             except Exception:
                 response.raise_for_status()
             else:
                 raise exc
+        if response.status_code == 304 and cached is not None:
+            # Not modified; mark the entry as recently used and parse the
+            # kept body again, since the caller is free to modify what we
+            # return
+            with self._conditional_cache_lock:
+                if self._conditional_cache.pop(cache_key, None) is not None:
+                    self._conditional_cache[cache_key] = cached
+            return json_loads(cached[2])
+        content = response.content
+        if not content:
+            # Empty response, eg when deleting or redirecting; no need to
+            # attempt (and fail) parsing it
+            return response
         try:
-            return response.json()
+            result = json_loads(content)
         except JSONDecodeError:
-            # Most likely empty response when deleting
             return response
+        if cache_key is not None:
+            self._remember_response(cache_key, response)
+        return result
+
+    def _remember_response(self, cache_key, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._conditional_cache_lock:
+            cache = self._conditional_cache
+            cache.pop(cache_key, None)
+            if etag is None and last_modified is None:
+                return
+            cache[cache_key] = (etag, last_modified, response.content)
+            while len(cache) > self.CONDITIONAL_CACHE_SIZE:
+                cache.popitem(last=False)
 
     def new(self, data=None, type=None, **kwargs):
         """ Return a new resource instance, using the appropriate Resource
@@ -125,20 +222,50 @@ class JsonApi(object):
                 data = data['data']
             return self.new(**data)
         else:
-            if type in self.registry:
-                klass = self.registry[type]
-            else:
-                # Lets make a new class on the fly
-                class klass(Resource):
-                    API = self
+            klass = self.registry.get(type, self._unregistered_class)
             return klass(**kwargs)
 
+    def _new_many(self, items, included=None, owned=False):
+        """ Like `new()`, for the items of a response's 'data' list. Since
+            these are always plain resource objects, `new()`'s unwrapping and
+            `Resource.__init__`'s checks are skipped, unless the subclass has
+            its own `__init__`. If `owned` is set, the items are used by the
+            instances without being copied.
+        """
+
+        # Hoisted out of the loop
+        default_init = six.get_unbound_function(Resource.__init__)
+        get_class = self.registry.get
+        unregistered_class = self._unregistered_class
+
+        # Items of a response are almost always of the same type, so only
+        # resolve the class when the type changes
+        result = []
+        previous_type = klass = has_default_init = None
+        for item in items:
+            type = item.get('type')
+            if klass is None or type != previous_type:
+                previous_type = type
+                klass = get_class(type, unregistered_class)
+                has_default_init = (
+                    six.get_unbound_function(klass.__init__) is default_init
+                )
+            if has_default_init:
+                instance = klass.__new__(klass)
+                instance._overwrite(included=included, _owned=owned, **item)
+            else:
+                instance = klass(included=included, _owned=owned, **item)
+            result.append(instance)
+        return result
+
     def as_resource(self, data):
         """ Little convenience function when we don't know if we are dealing
             with a Resource instance or a dict describing a relationship. Will
             use the appropriate Resource subclass.
         """
 
+        if data is None or isinstance(data, Resource):
+            return data
         try:
             return self.new(data)
         except Exception:
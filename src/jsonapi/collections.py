@@ -2,12 +2,20 @@ from __future__ import absolute_import, unicode_literals
 
 from .compat import abc, parse_qs, urlparse
 from .exceptions import DoesNotExist, MultipleObjectsReturned
+from .utils import executor, index_included
 
 
 class Collection(abc.MutableSequence):
+    __slots__ = ('API', '_url', '_params', '_data', '_next_url',
+                 '_previous_url')
+
     def __init__(self, API, url, params=None):
+        # Derived collections pass their parent's params; copy them so that
+        # chaining never affects the parent's (still unevaluated) request
         if params is None:
             params = {}
+        else:
+            params = dict(params)
 
         parsed = urlparse(url)
         path, query = parsed.path, parsed.query
@@ -52,28 +60,21 @@ class Collection(abc.MutableSequence):
         if self._data is not None:
             return
 
-        if response_body is None:
+        # If we make the request ourselves, nobody else has a reference to
+        # the response body so it doesn't need to be copied
+        owned = response_body is None
+        if owned:
             response_body = self.API.request('get', self._url,
                                              params=self._params)
-        included = {}
-        if 'included' in response_body:
-            included = {(item['type'], item['id']): item
-                        for item in response_body['included']}
-
-        self._data = []
-        for item in response_body['data']:
-            related = {}
-            for (name, relationship) in item.get('relationships', {}).items():
-                if relationship is None or 'data' not in relationship:
-                    continue
-                key = (relationship['data']['type'],
-                       relationship['data']['id'])
-                if key in included:
-                    related[name] = self.API.new(included[key])
-            relationships = item.pop('relationships', {})
-            relationships.update(related)
-            self._data.append(self.API.new(relationships=relationships,
-                                           **item))
+        # Index the included items once for the whole page, rather than
+        # once per item. They are also turned into Resource instances once,
+        # so that all items that refer to the same included item share it
+        included = response_body.get('included', [])
+        included = index_included(included,
+                                  self.API._new_many(included, owned=owned))
+
+        self._data = self.API._new_many(response_body['data'], included,
+                                        owned=owned)
 
         self._next_url = response_body.get('links', {}).get('next')
         self._previous_url = response_body.get('links', {}).get('previous')
@@ -130,12 +131,20 @@ class Collection(abc.MutableSequence):
         return self.__class__(self.API, self.previous_url, self._params)
 
     def all_pages(self):
-        if self.data:
-            yield self
         page = self
-        while page.has_next():
-            page = page.next()
-            yield page
+        while True:
+            # Start fetching the next page in the background so that the
+            # request overlaps with the consumption of the current page
+            next_page = None
+            if page.has_next():
+                next_page = page.next()
+                future = executor.submit(next_page._evaluate)
+            if page is not self or page.data:
+                yield page
+            if next_page is None:
+                break
+            future.result()
+            page = next_page
 
     def all(self):
         for page in self.all_pages():
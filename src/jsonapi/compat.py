@@ -7,6 +7,27 @@ try:
 except AttributeError:
     JSONDecodeError = ValueError
 
+# Optional requirement; much faster than the standard library for large
+# payloads. Both `json_loads` and `json_dumps` work with bytes
+try:
+    import orjson
+except ImportError:
+    def json_loads(content):
+        return json.loads(content.decode('utf-8'))
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+else:
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter than the standard library, eg it rejects
+            # non-string dict keys and integers wider than 64 bits
+            return json.dumps(obj).encode('utf-8')
+
 try:
     import collections.abc as abc
 except ImportError:
@@ -15,3 +36,7 @@ try:
     from urllib.parse import parse_qs, urlparse
 except ImportError:
     from urlparse import parse_qs, urlparse  # noqa
+try:
+    from http.cookiejar import DefaultCookiePolicy
+except ImportError:
+    from cookielib import DefaultCookiePolicy  # noqa
@@ -1,13 +1,24 @@
 from __future__ import absolute_import, unicode_literals
 
-from copy import deepcopy
+from concurrent.futures import wait
 
 import requests
 
 from .collections import Collection
-from .utils import (has_data, has_links, is_collection, is_dict, is_fetched,
-                    is_list, is_null, is_related, is_related_list, is_resource,
-                    is_resource_identifier)
+from .exceptions import JsonApiException
+from .utils import (executor, has_data, has_links, index_included,
+                    intern_type, is_collection, is_dict, is_fetched, is_list,
+                    is_null, is_related, is_related_list, is_resource,
+                    is_resource_identifier, json_clone)
+
+# Names that are never resolved through the `attributes`/`related` shortcuts
+_NO_SHORTCUT_SET = frozenset(('id', 'attributes', 'relationships', 'related',
+                              'links', 'redirect', 'API'))
+_NO_SHORTCUT_GET = _NO_SHORTCUT_SET | frozenset(('a', 'R', 'r'))
+
+# Keys that make a dict passed to `bulk_create` a resource object rather than
+# a dict of attributes
+_RESOURCE_OBJECT_KEYS = frozenset(('id', 'attributes', 'relationships'))
 
 
 class Resource(object):
@@ -18,10 +29,15 @@ class Resource(object):
             ...     EDITABLE = ['name', 'age', 'parent']
 
         EDITABLE values can either be names of attributes or relationships.
+
+        If BULK_CHUNK_SIZE is set, bulk operations send at most that many
+        items per request; larger inputs are split into several requests
+        which are sent concurrently.
     """
 
     TYPE = None
     EDITABLE = None
+    BULK_CHUNK_SIZE = None
 
     # Creation
     def __init__(self, data=None, **kwargs):
@@ -55,60 +71,75 @@ class Resource(object):
                    redirect=None,
                    # Ignored
                    type=None,
+                   # Set when the caller hands over ownership of the values
+                   # (eg a freshly parsed response body), so they don't need
+                   # to be copied
+                   _owned=False,
                    # Magic
                    **kwargs):
         """ Write to the basic attributes of Resource. Used by '__init__',
             'reload', '__copy__' and 'save'
+
+            'included' can either be the 'included' list of an API response
+            or a `{(type, id): item}` index of it, so that a collection can
+            build the index once for all of its items (the index's values can
+            also be Resource instances).
         """
 
-        # Handle "magic" kwargs
+        # Copy from response. Only what was passed in needs copying; the
+        # empty defaults below are ours
+        if not _owned:
+            attributes = json_clone(attributes)
+            relationships = json_clone(relationships)
+            links = json_clone(links)
+            if kwargs:
+                kwargs = json_clone(kwargs)
         if attributes is None:
             attributes = {}
         if relationships is None:
             relationships = {}
+        if links is None:
+            links = {}
+
+        # Handle "magic" kwargs
         for key, value in kwargs.items():
             if is_related(value) or is_related_list(value):
                 relationships[key] = value
             else:
                 attributes[key] = value
 
-        # Copy from response
-        self.id = id
-
-        self.attributes = deepcopy(attributes)
-
-        if links is not None:
-            self.links = deepcopy(links)
-        else:
-            self.links = {}
-
-        self.redirect = redirect
-
-        # Relationships
-        self.relationships, self.related = {}, {}
-        for key, value in deepcopy(relationships).items():
+        # Write to `__dict__` directly; going through `__setattr__`'s
+        # shortcut handling for every field is wasted work when constructing
+        # many objects
+        self.__dict__.update(id=id,
+                             attributes=attributes,
+                             links=links,
+                             redirect=redirect,
+                             relationships={},
+                             related={})
+
+        # Relationships; in a single pass, prefer the included version of
+        # related objects if available
+        if included and not is_dict(included):
+            included = index_included(included)
+        for key, value in relationships.items():
             self._set_relationship(key, value)
             relationship = self.relationships[key]
-            if is_null(relationship) or has_data(relationship):
-                self.set_related(key, value)
-
-        if included is not None:
-            included = {(item['type'], item['id']): item for item in included}
-            for relationship_name, relationship in self.relationships.items():
-                if is_null(relationship) or not has_data(relationship):
-                    continue
-                if is_list(relationship['data']):  # Plural with data
-                    new_items = [
-                        included.get((r['type'], r['id']),
-                                     self.related[relationship_name][i])
-                        for i, r in enumerate(relationship['data'])
-                    ]
-                    self.set_related(relationship_name, new_items)
+            if is_null(relationship):
+                self.set_related(key, None)
+                continue
+            if not has_data(relationship):
+                continue
+            data = relationship['data']
+            if included:
+                if is_list(data):  # Plural with data
+                    if has_data(value):
+                        value = value['data']
+                    value = [included.get((r['type'], r['id']), item)
+                             for r, item in zip(data, value)]
                 else:  # Singular
-                    key = (relationship['data']['type'],
-                           relationship['data']['id'])
-                    if key in included:
-                        self.set_related(relationship_name, included[key])
+                    value = included.get((data['type'], data['id']), value)
+            self.set_related(key, value)
 
     def _set_relationship(self, key, value):
         """ Set 'value' as 'key' relationship. For value we accept:
@@ -125,7 +156,13 @@ class Resource(object):
             response's relationships.
         """
 
-        if is_related_list(value):
+        # Cheap checks for the most common cases first; `is_related_list`
+        # has to inspect every item
+        if value is None:
+            self.relationships[key] = None
+        elif isinstance(value, Resource):
+            self.relationships[key] = value.as_relationship()
+        elif is_related_list(value):
             if has_data(value):
                 data = value['data']
             else:
@@ -136,12 +173,12 @@ class Resource(object):
             ]}
             if has_links(value):
                 self.relationships[key]['links'] = value['links']
-        elif is_resource(value):
-            self.relationships[key] = value.as_relationship()
         else:
-            if not is_null(value) and is_resource_identifier(value):
+            if is_resource_identifier(value):
                 value = {'data': value}
-            if is_null(value) or has_data(value) or has_links(value):
+            if has_data(value) or has_links(value):
+                if has_data(value) and is_resource_identifier(value['data']):
+                    value['data']['type'] = intern_type(value['data']['type'])
                 self.relationships[key] = value
             else:
                 raise ValueError("Invalid type '{}' for relationship '{}'".
@@ -204,6 +241,8 @@ class Resource(object):
             with a Resource instance or a dict describing a relationship.
         """
 
+        if isinstance(data, Resource):
+            return data
         try:
             return cls(data)
         except Exception:
@@ -226,20 +265,19 @@ class Resource(object):
 
     # Shortcuts
     def __getattr__(self, attr):
-        if attr in ('a', 'attributes', 'R', 'relationships', 'r', 'related',
-                    'id', 'links', 'redirect', 'API'):
-            return super(Resource, self).__getattribute__(attr)
-        elif attr in self.attributes:
-            return self.attributes[attr]
-        elif attr in self.related:
-            return self.related[attr]
-        else:
-            return super(Resource, self).__getattribute__(attr)
+        # Only invoked when normal attribute lookup has failed
+        if attr not in _NO_SHORTCUT_GET:
+            attributes = self.attributes
+            if attr in attributes:
+                return attributes[attr]
+            related = self.related
+            if attr in related:
+                return related[attr]
+        return object.__getattribute__(self, attr)
 
     def __setattr__(self, attr, value):
-        if attr in ('id', 'attributes', 'relationships', 'related', 'links',
-                    'redirect', 'API'):
-            super(Resource, self).__setattr__(attr, value)
+        if attr in _NO_SHORTCUT_SET:
+            object.__setattr__(self, attr, value)
         elif attr in self.attributes:
             self.attributes[attr] = value
         elif attr in self.relationships:
@@ -248,7 +286,7 @@ class Resource(object):
             except ValueError as e:
                 raise AttributeError(str(e))
         else:
-            super(Resource, self).__setattr__(attr, value)
+            object.__setattr__(self, attr, value)
 
     # Fetching
     def reload(self, include=None):
@@ -258,12 +296,14 @@ class Resource(object):
         if include is not None:
             params = {'include': ','.join(include)}
         url = self.links.get('self', self.get_item_url())
-        response_body = self.API.request('get', url, params=params)
+        response_body = self.API.request('get', url, params=params,
+                                         conditional=True)
         if (isinstance(response_body, requests.Response) and
                 response_body.status_code == 303):
             self._overwrite(redirect=response_body.headers['Location'])
         else:
             self._overwrite(included=response_body.get('included'),
+                            _owned=True,
                             **response_body['data'])
 
     @classmethod
@@ -318,6 +358,7 @@ class Resource(object):
                 raise ValueError("{} doesn't have relationship '{}'".
                                  format(repr(self), relationship_name))
 
+        singular_names = []
         for relationship_name in relationship_names:
             relationship = self.relationships[relationship_name]
 
@@ -334,7 +375,7 @@ class Resource(object):
 
             if has_data(relationship) and not is_list(relationship['data']):
                 # Singular relationship
-                self.related[relationship_name].reload()
+                singular_names.append(relationship_name)
             else:
                 # Plural relationship
                 url = relationship.\
@@ -343,17 +384,79 @@ class Resource(object):
                                                       relationship_name))
                 self.related[relationship_name] = Collection(self.API, url)
 
+        if len(singular_names) > 1 and self.id is not None:
+            # Ask for all of them in one request
+            singular_names = self._fetch_included(singular_names)
+
+        # Whatever wasn't included is fetched individually; the relationships
+        # are independent of each other, so if there are many, fetch them
+        # concurrently
+        to_reload = []
+        for relationship_name in singular_names:
+            related = self.related[relationship_name]
+            if not any((related is item for item in to_reload)):
+                to_reload.append(related)
+        if len(to_reload) == 1:
+            to_reload[0].reload()
+        else:
+            futures = [executor.submit(related.reload)
+                       for related in to_reload]
+            for future in futures:
+                future.result()
+
         if len(relationship_names) == 1:
             # This way you can do `project.fetch('languages').filter(...)`
             return self.related[relationship_names[0]]
 
+    def _fetch_included(self, relationship_names):
+        """ Fetch singular relationships by requesting 'self' with them
+            included. Returns the names of the relationships that the server
+            did not include.
+        """
+
+        url = self.links.get('self', self.get_item_url())
+        try:
+            response_body = self.API.request(
+                'get', url, params={'include': ','.join(relationship_names)},
+            )
+        except (JsonApiException, requests.HTTPError):
+            # Most likely the server doesn't support including some of them
+            return relationship_names
+        if isinstance(response_body, requests.Response):
+            return relationship_names
+
+        included = index_included(response_body.get('included', []))
+        missing = []
+        # Each related instance is populated once; an included item is
+        # handed over to the first instance that uses it and copied for the
+        # rest, so that they don't share their attributes
+        overwritten = []
+        used = set()
+        for relationship_name in relationship_names:
+            data = self.relationships[relationship_name]['data']
+            key = (data['type'], data['id'])
+            item = included.get(key)
+            if item is None:
+                missing.append(relationship_name)
+                continue
+            related = self.related[relationship_name]
+            if any((related is other for other in overwritten)):
+                continue
+            related._overwrite(_owned=key not in used, **item)
+            overwritten.append(related)
+            used.add(key)
+        return missing
+
     @classmethod
     def list(cls):
-        return Collection(cls.API, "/{}".format(cls.TYPE))
+        return Collection(cls.API, cls.get_collection_url())
 
     def _collection_method(method):
+        # Resolved once here rather than on every call
+        function = getattr(Collection, method)
+
         def _method(cls, *args, **kwargs):
-            return getattr(cls.list(), method)(*args, **kwargs)
+            return function(cls.list(), *args, **kwargs)
         return classmethod(_method)
 
     filter = _collection_method('filter')
@@ -418,15 +521,20 @@ class Resource(object):
         result = {}
         editable_fields = fields or self.EDITABLE
         if editable_fields is not None:
+            attributes, relationships = {}, {}
+            self_attributes, self_relationships = (self.attributes,
+                                                   self.relationships)
             for field in editable_fields:
-                if field in self.attributes:
-                    result.setdefault('attributes', {})[field] =\
-                        self.attributes[field]
-                elif field in self.relationships:
-                    result.setdefault('relationships', {})[field] =\
-                        self.relationships[field]
+                if field in self_attributes:
+                    attributes[field] = self_attributes[field]
+                elif field in self_relationships:
+                    relationships[field] = self_relationships[field]
                 else:
                     raise ValueError("Unknown field '{}'".format(field))
+            if attributes:
+                result['attributes'] = attributes
+            if relationships:
+                result['relationships'] = relationships
         else:
             if self.attributes:
                 result['attributes'] = self.attributes
@@ -442,35 +550,36 @@ class Resource(object):
             return
 
         data = response_body['data']
+        relationships = data.pop('relationships', {})
 
-        related = deepcopy(self.related)
-        for relationship_name, related_instance in list(related.items()):
+        # Keep the related instances whose ids didn't change, so that
+        # whatever was fetched for them isn't lost
+        related = {}
+        for relationship_name, related_instance in self.related.items():
             if is_collection(related_instance):
-                continue  # Plural relationship
+                # Plural relationship
+                related[relationship_name] = related_instance
+                continue
 
-            try:
-                current_id = related_instance.id
-            except Exception:
-                current_id = None
-            try:
-                new_id = data['relationships'][relationship_name]['data']['id']
-            except Exception:
+            current_id = getattr(related_instance, 'id', None)
+            new_relationship = relationships.get(relationship_name)
+            if (has_data(new_relationship) and
+                    is_dict(new_relationship['data'])):
+                new_id = new_relationship['data'].get('id')
+            else:
                 new_id = None
-            if current_id != new_id:
-                if new_id is not None:
-                    # Relationship changed, reset
-                    related[relationship_name] = self.API.new(
-                        data['relationships'][relationship_name]
-                    )
-                else:
-                    # Relationship removed
-                    del related[relationship_name]
+            if current_id == new_id:
+                related[relationship_name] = related_instance
+            elif new_id is not None:
+                # Relationship changed, reset
+                related[relationship_name] = self.API.new(new_relationship)
+            # Else relationship removed
 
-        relationships = data.pop('relationships', {})
         relationships.update(related)
 
         self._overwrite(relationships=relationships,
                         included=response_body.get('included'),
+                        _owned=True,
                         **data)
 
     @classmethod
@@ -547,8 +656,15 @@ class Resource(object):
         """
 
         value = self.API.as_resource(value)
-        self._edit_relationship('patch', field, value.as_resource_identifier())
-        self.relationships[field]['data'] = value.as_resource_identifier()
+        if value is None:
+            identifier = None
+        else:
+            identifier = value.as_resource_identifier()
+        self._edit_relationship('patch', field, identifier)
+        if self.relationships[field] is None:
+            self.relationships[field] = {'data': identifier}
+        else:
+            self.relationships[field]['data'] = identifier
         if self.related[field] != value:
             self.related[field] = value
 
@@ -633,7 +749,7 @@ class Resource(object):
         self._edit_plural_relationship('patch', field, values)
 
     def _edit_relationship(self, method, field, value):
-        url = self.relationships[field].\
+        url = (self.relationships[field] or {}).\
             get('links', {}).\
             get('self',
                 "/{}/{}/relationships/{}".format(self.TYPE, self.id, field))
@@ -668,18 +784,20 @@ class Resource(object):
                 >>> Foo.bulk_delete(foos)
         """
 
+        # Build the resource identifiers directly instead of instantiating a
+        # Resource for every item first
         payload = []
-
         for item in items:
-            item = cls.as_resource(item)
-            if not is_resource(item):
-                item = cls(id=item)
-            payload.append(item.as_resource_identifier())
+            if is_resource(item):
+                payload.append(item.as_resource_identifier())
+            elif is_dict(item):
+                if has_data(item):
+                    item = item['data']
+                payload.append({'type': cls.TYPE, 'id': item['id']})
+            else:
+                payload.append({'type': cls.TYPE, 'id': item})
 
-        cls.API.request('delete',
-                        cls.get_collection_url(),
-                        json={'data': payload},
-                        bulk=True)
+        cls._bulk_request('delete', payload)
         return len(payload)
 
     @classmethod
@@ -715,15 +833,32 @@ class Resource(object):
                 ...                             ...])
         """
 
+        # Dispatch on the item's type rather than trying to construct a
+        # Resource and catching the failure
         payload = []
         for item in items:
-            if is_list(item):
+            if is_resource(item):
+                pass
+            elif is_list(item):
                 attributes, relationships = item
                 item = cls(attributes=attributes, relationships=relationships)
+            elif is_dict(item):
+                if ((has_data(item) and is_dict(item['data'])) or
+                        not _RESOURCE_OBJECT_KEYS.isdisjoint(item)):
+                    item = cls(item)
+                else:
+                    # Attributes; like the constructor's "magic" kwargs,
+                    # related values among them are relationships
+                    attributes, relationships = {}, {}
+                    for key, value in item.items():
+                        if is_related(value) or is_related_list(value):
+                            relationships[key] = value
+                        else:
+                            attributes[key] = value
+                    item = cls(attributes=attributes,
+                               relationships=relationships)
             else:
-                item = cls.as_resource(item)
-                if not isinstance(item, Resource):
-                    item = cls(attributes=item)
+                item = cls(attributes=item)
 
             payload.append({'type': cls.TYPE})
             if item.attributes:
@@ -733,11 +868,9 @@ class Resource(object):
             if item.id:
                 payload[-1]['id'] = item.id
 
-        response_body = cls.API.request('post',
-                                        cls.get_collection_url(),
-                                        json={'data': payload},
-                                        bulk=True)
-        return Collection.from_data(cls.API, response_body)
+        response_bodies = cls._bulk_request('post', payload)
+        return Collection.from_data(cls.API,
+                                    _merge_response_bodies(response_bodies))
 
     @classmethod
     def bulk_update(cls, items, fields=None):
@@ -765,23 +898,27 @@ class Resource(object):
 
         if fields is None:
             fields = cls.EDITABLE
+        if fields:
+            # Checked against every key of every item
+            fields = frozenset(fields)
 
         payload = []
         for item in items:
-
-            if is_list(item):
-                try:
+            if is_resource(item):
+                pass
+            elif is_list(item):
+                if len(item) == 3:
                     id, attributes, relationships = item
-                except ValueError:
+                else:
                     id, attributes = item
                     relationships = None
                 item = cls(id=id,
                            attributes=attributes,
                            relationships=relationships)
+            elif is_dict(item):
+                item = cls(item)
             else:
-                item = cls.as_resource(item)
-                if not isinstance(item, Resource):
-                    item = cls(id=item)
+                item = cls(id=item)
 
             if item.id is None:
                 raise ValueError("'id' not supplied as part of an update "
@@ -802,21 +939,69 @@ class Resource(object):
             if attributes:
                 payload[-1]['attributes'] = attributes
             if relationships:
-                payload[-1]['relationships'] = {
-                    key: cls.API.as_resource(value).as_relationship()
-                    for key, value in relationships.items()
-                }
+                payload[-1]['relationships'] = {}
+                for key, value in relationships.items():
+                    if is_null(value) or (has_data(value) and
+                                          is_null(value['data'])):
+                        value = {'data': None}
+                    else:
+                        value = cls.API.as_resource(value).as_relationship()
+                    payload[-1]['relationships'][key] = value
+
+        response_bodies = cls._bulk_request('patch', payload)
+        return Collection.from_data(cls.API,
+                                    _merge_response_bodies(response_bodies))
 
-        response_body = cls.API.request('patch',
-                                        cls.get_collection_url(),
-                                        json={'data': payload},
-                                        bulk=True)
-        return Collection.from_data(cls.API, response_body)
+    @classmethod
+    def _bulk_request(cls, method, payload):
+        """ Send 'payload' to the collection URL using the 'bulk' profile, in
+            chunks of up to `BULK_CHUNK_SIZE` items. If there are more than
+            one, the chunks are sent concurrently. Returns the response bodies
+            in the order of the chunks.
+        """
+
+        url = cls.get_collection_url()
+        size = cls.BULK_CHUNK_SIZE or len(payload)
+        if len(payload) <= size:
+            return [cls.API.request(method, url, json={'data': payload},
+                                    bulk=True)]
+
+        futures = [executor.submit(cls.API.request, method, url,
+                                   json={'data': payload[start:start + size]},
+                                   bulk=True)
+                   for start in range(0, len(payload), size)]
+        # Let every chunk finish before raising the first error, if any, so
+        # that nothing is still being sent when the caller gets to handle it
+        wait(futures)
+        return [future.result() for future in futures]
 
     # Utils
     def __eq__(self, other):
-        other = self.API.as_resource(other)
-        return self.as_resource_identifier() == other.as_resource_identifier()
+        if is_resource(other):
+            return self.TYPE == other.TYPE and self.id == other.id
+        elif is_dict(other):
+            other = other.get('data', other)
+            if not is_dict(other):
+                # Eg a null relationship
+                return False
+            return (other.get('type') == self.TYPE and
+                    other.get('id') == self.id)
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        # Python 2 doesn't derive `!=` from `==`
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        # Unsaved instances are all equal to each other and would change
+        # their hash once saved
+        if self.id is None:
+            raise TypeError("Resource instances without an ID are unhashable")
+        return hash((self.TYPE, self.id))
 
     def __repr__(self):
         if self.__class__ is Resource:
@@ -838,8 +1023,9 @@ class Resource(object):
         return repr("<{}: {}>".format(class_name, details))
 
     def __copy__(self):
-        # Will eventually call `_overwrite` so `deepcopy` will be used
-        relationships = deepcopy(self.relationships)
+        # Will eventually call `_overwrite` which will copy everything, this
+        # copy is only there so that `update` doesn't affect `self`
+        relationships = dict(self.relationships)
         relationships.update(self.related)
         return self.__class__(id=self.id, attributes=self.attributes,
                               relationships=relationships, links=self.links,
@@ -849,7 +1035,7 @@ class Resource(object):
         return {'type': self.TYPE, 'id': self.id}
 
     def as_relationship(self):
-        return {'data': self.as_resource_identifier()}
+        return {'data': {'type': self.TYPE, 'id': self.id}}
 
     @classmethod
     def get_collection_url(cls):
@@ -860,3 +1046,16 @@ class Resource(object):
             return self.links['self']
         else:
             return "/{}/{}".format(self.TYPE, self.id)
+
+
+def _merge_response_bodies(response_bodies):
+    """ Combine the response bodies of a chunked bulk operation into one """
+
+    if len(response_bodies) == 1:
+        return response_bodies[0]
+
+    result = {'data': [], 'included': []}
+    for response_body in response_bodies:
+        result['data'].extend(response_body['data'])
+        result['included'].extend(response_body.get('included', []))
+    return result
@@ -1,9 +1,17 @@
 from __future__ import absolute_import, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
+
 import six
 
 from .compat import abc
 
+# Background workers for requests that can overlap with other work, eg
+# fetching the next page of a collection while the current one is consumed
+executor = ThreadPoolExecutor(max_workers=4)
+
+_types = {}
+
 
 def is_resource(value):
     from .resources import Resource
@@ -64,3 +72,37 @@ def is_related_list(value):
 
 def is_fetched(value):
     return is_resource(value) and (value.attributes or value.relationships)
+
+
+def intern_type(value):
+    """ Return a shared copy of a resource identifier's 'type'. Long
+        collections repeat the same few types over and over in their
+        relationships; this way they don't each keep their own string.
+    """
+
+    return _types.setdefault(value, value)
+
+
+def index_included(items, values=None):
+    """ Map the `(type, id)` of each of a response's 'included' items to the
+        item itself, or to the respective entry of 'values' if given (eg the
+        Resource instances created from the items).
+    """
+
+    if values is None:
+        values = items
+    return dict(zip([(item['type'], item['id']) for item in items], values))
+
+
+def json_clone(value):
+    """ Copy a JSON-like structure. Dicts and lists are copied recursively,
+        everything else (strings, numbers, Resource instances etc) is shared.
+        Much cheaper than `deepcopy`.
+    """
+
+    if isinstance(value, dict):
+        return {key: json_clone(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [json_clone(item) for item in value]
+    else:
+        return value
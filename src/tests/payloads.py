@@ -1,6 +1,14 @@
 from __future__ import absolute_import, unicode_literals
 
-from copy import deepcopy
+import json
+
+
+def copy_payload(payload):
+    """ Deep copy for JSON-compatible structures; much cheaper than
+        `copy.deepcopy` since it doesn't have to handle arbitrary objects.
+    """
+
+    return json.loads(json.dumps(payload))
 
 
 class Payloads(object):
@@ -23,7 +31,7 @@ class Payloads(object):
 
         self.plural_type = plural_type
         self.singular_type = singular_type
-        self.extra = deepcopy(extra)
+        self.extra = copy_payload(extra)
 
     def __getitem__(self, index):
         if isinstance(index, slice):
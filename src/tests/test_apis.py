@@ -1,7 +1,10 @@
 from __future__ import absolute_import, unicode_literals
 
+import responses
+
 import jsonapi
 from jsonapi.auth import ULFAuthentication
+from jsonapi.compat import json_dumps, json_loads
 
 from .constants import host
 
@@ -23,6 +26,61 @@ def test_class_registry():
     assert _api.registry['globaltests'] is GlobalTest
 
 
+def test_new_with_unregistered_type():
+    first = _api.new(type="unknowns", id="1")
+    second = _api.new(type="unknowns", id="2")
+    assert isinstance(first, jsonapi.Resource)
+    assert not isinstance(first, GlobalTest)
+    assert first.__class__ is second.__class__
+    assert first.API is _api
+
+
+@_api.register
+class CustomInit(jsonapi.Resource):
+    TYPE = "custominits"
+
+    def __init__(self, *args, **kwargs):
+        super(CustomInit, self).__init__(*args, **kwargs)
+        self.initialized = True
+
+
+def test_new_many():
+    globaltest, custominit = _api._new_many([
+        {'type': "globaltests", 'id': "1", 'attributes': {'name': "one"}},
+        {'type': "custominits", 'id': "2"},
+    ])
+    assert isinstance(globaltest, GlobalTest)
+    assert globaltest.id == "1"
+    assert globaltest.name == "one"
+    assert isinstance(custominit, CustomInit)
+    assert custominit.initialized
+
+
+def test_session():
+    adapter = _api.session.get_adapter(host)
+    assert adapter is _api.session.get_adapter("http://some.host")
+    assert adapter.max_retries.total == 3
+
+
+@responses.activate
+def test_session_ignores_cookies():
+    responses.add(responses.GET, "{}/globaltests/1".format(host),
+                  json={'data': {'type': "globaltests", 'id': "1"}},
+                  headers={'Set-Cookie': "session=abc; Path=/"})
+
+    api = jsonapi.JsonApi(host=host, auth="test_api_key")
+    api.request('get', "/globaltests/1")
+    api.request('get', "/globaltests/1")
+
+    assert len(api.session.cookies) == 0
+    assert 'Cookie' not in responses.calls[1].request.headers
+
+
+def test_json_dumps_non_string_keys():
+    payload = {1: "a", 'b': [2 ** 70]}
+    assert json_loads(json_dumps(payload)) == {'1': "a", 'b': [2 ** 70]}
+
+
 def test_setup_plaintext():
     _api.setup("http://some.host", "another_key")
     assert _api.make_auth_headers() == {'Authorization': "Bearer another_key"}
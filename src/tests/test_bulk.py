@@ -76,6 +76,18 @@ def test_bulk_create():
                 "now + {}".format(i + 1))
 
 
+@responses.activate
+def test_bulk_create_attributes_with_data_key():
+    responses.add(responses.POST, "{}/bulk_items".format(host),
+                  json={'data': [{'type': "bulk_items", 'id': "1"}]})
+
+    BulkItem.bulk_create([{'data': "blob", 'name': "y"}])
+
+    assert (json.loads(responses.calls[0].request.body.decode()) ==
+            {'data': [{'type': "bulk_items",
+                       'attributes': {'data': "blob", 'name': "y"}}]})
+
+
 @responses.activate
 def test_bulk_update():
     response_payload = payloads[1:6]
@@ -117,3 +129,53 @@ def test_bulk_update():
         assert (result[i].last_update ==
                 result[i].attributes['last_update'] ==
                 "now + {}".format(i + 1))
+
+
+@responses.activate
+def test_bulk_update_null_relationship():
+    responses.add(responses.PATCH, "{}/bulk_items".format(host),
+                  json={'data': [{'type': "bulk_items", 'id': "1"}]})
+
+    item = BulkItem({'type': "bulk_items",
+                     'id': "1",
+                     'relationships': {'parent': None}})
+    BulkItem.bulk_update([item])
+
+    assert len(responses.calls) == 1
+    assert (json.loads(responses.calls[0].request.body.decode()) ==
+            {'data': [{'type': "bulk_items",
+                       'id': "1",
+                       'relationships': {'parent': {'data': None}}}]})
+
+
+@responses.activate
+def test_bulk_delete_not_chunked_by_default():
+    responses.add(responses.DELETE, "{}/bulk_items".format(host))
+
+    assert BulkItem.bulk_delete([str(i) for i in range(150)]) == 150
+    assert len(responses.calls) == 1
+
+
+class ChunkedBulkItem(BulkItem):
+    BULK_CHUNK_SIZE = 2
+
+
+@responses.activate
+def test_bulk_create_in_chunks():
+    def callback(request):
+        data = json.loads(request.body.decode())['data']
+        response_payload = [dict(item, id=item['attributes']['name'][-1])
+                            for item in data]
+        return 201, {}, json.dumps({'data': response_payload})
+
+    responses.add_callback(responses.POST, "{}/bulk_items".format(host),
+                           callback=callback)
+
+    result = ChunkedBulkItem.bulk_create(
+        [{'name': "bulk_item {}".format(i)} for i in range(1, 6)]
+    )
+
+    assert len(responses.calls) == 3
+    assert sorted(len(json.loads(call.request.body.decode())['data'])
+                  for call in responses.calls) == [1, 2, 2]
+    assert [item.id for item in result] == ["1", "2", "3", "4", "5"]
@@ -1,14 +1,12 @@
 from __future__ import absolute_import, unicode_literals
 
-from copy import deepcopy
-
 import responses
 
 import jsonapi
 from jsonapi.compat import abc
 
 from .constants import host
-from .payloads import Payloads
+from .payloads import Payloads, copy_payload
 
 _api = jsonapi.JsonApi(host=host, auth="test_api_key")
 
@@ -54,7 +52,7 @@ def test_plural_list():
 
 
 def test_included():
-    payload = deepcopy(PAYLOAD)
+    payload = copy_payload(PAYLOAD)
     payload['included'] = child_payloads[1:3]
     parent = Parent(payload)
     make_simple_assertions(parent)
@@ -63,6 +61,22 @@ def test_included():
     assert parent.children[1].name == "child 2"
 
 
+@responses.activate
+def test_included_in_collection():
+    payload = copy_payload(PAYLOAD)
+    payload['data'] = [payload['data']]
+    payload['included'] = child_payloads[1:3]
+    responses.add(responses.GET, "{}/parents".format(host), json=payload)
+
+    parent = Parent.list()[0]
+    make_simple_assertions(parent)
+
+    assert parent.children[0].name == "child 1"
+    assert parent.children[1].name == "child 2"
+    assert (parent.relationships['children']['links'] ==
+            {'related': "/parents/1/children"})
+
+
 @responses.activate
 def test_refetch():
     responses.add(responses.GET, "{}/parents/1/children".format(host),
@@ -79,7 +93,7 @@ def test_refetch():
 
 @responses.activate
 def test_save_with_included():
-    payload = deepcopy(PAYLOAD)
+    payload = copy_payload(PAYLOAD)
     payload['included'] = child_payloads[1:3]
     responses.add(responses.PATCH, "{}/parents/1".format(host), json=payload)
     parent = Parent(PAYLOAD)
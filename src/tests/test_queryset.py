@@ -1,5 +1,7 @@
 from __future__ import absolute_import, unicode_literals
 
+import time
+
 import responses
 
 import jsonapi
@@ -21,6 +23,15 @@ class Tag(jsonapi.Resource):
     TYPE = "tags"
 
 
+@_api.register
+class CustomUrlItem(jsonapi.Resource):
+    TYPE = "custom_url_items"
+
+    @classmethod
+    def get_collection_url(cls):
+        return "/custom_items"
+
+
 payloads = Payloads('items')
 
 
@@ -102,6 +113,17 @@ def test_all():
     assert list(collection) == list(collection.all())
 
 
+@responses.activate
+def test_list_with_custom_url():
+    responses.add(responses.GET, "{}/custom_items".format(host),
+                  json={'data': Payloads('custom_url_items')[1:3]})
+
+    collection = CustomUrlItem.filter(name="custom_url_item 1")
+
+    assert len(collection) == 2
+    assert isinstance(collection[0], CustomUrlItem)
+
+
 @responses.activate
 def test_all_with_pagination():
     responses.add(responses.GET, "{}/items".format(host),
@@ -120,6 +142,7 @@ def test_all_with_pagination():
     list(second_page)
 
     assert len(responses.calls) == 2
+    assert first_page._params == {}
 
     assert len(second_page) == 3
     assert isinstance(second_page[0], Item)
@@ -134,6 +157,39 @@ def test_all_with_pagination():
             [list(first_page), list(second_page)])
 
 
+@responses.activate
+def test_all_pages_prefetches_one_page():
+    for page in (1, 2, 3):
+        links = {}
+        if page < 3:
+            links['next'] = "/items?page={}".format(page + 1)
+        responses.add(
+            responses.GET,
+            "{}/items{}".format(host,
+                                "" if page == 1 else "?page={}".format(page)),
+            json={'data': payloads[page * 2 - 1:page * 2 + 1],
+                  'links': links},
+            match_querystring=True,
+        )
+
+    pages = Item.list().all_pages()
+    first_page = next(pages)
+    pages.close()
+
+    # The second page is fetched in the background; give it a chance to
+    # finish, the third one must never be requested
+    deadline = time.time() + 2
+    while len(responses.calls) < 2 and time.time() < deadline:
+        time.sleep(.01)
+    time.sleep(.05)
+    assert len(responses.calls) == 2
+    assert [item.id for item in first_page] == ["1", "2"]
+
+    assert ([[item.id for item in page]
+             for page in Item.list().all_pages()] ==
+            [["1", "2"], ["3", "4"], ["5", "6"]])
+
+
 @responses.activate
 def test_filter():
     responses.add(responses.GET, "{}/items".format(host),
@@ -154,6 +210,23 @@ def test_filter():
             list(Item.filter(odd=2).filter(odd=1)))
 
 
+@responses.activate
+def test_chaining_is_lazy():
+    responses.add(responses.GET,
+                  "{}/items?filter[odd]=1&sort=name".format(host),
+                  json={'data': payloads[1:5:2]}, match_querystring=True)
+
+    collection = Item.list()
+    odd_items = collection.filter(odd=2).filter(odd=1).sort('name')
+
+    assert len(responses.calls) == 0
+    assert collection._params == {}
+
+    assert len(odd_items) == 2
+    assert list(odd_items) == [Item(id="1"), Item(id="3")]
+    assert len(responses.calls) == 1
+
+
 @responses.activate
 def test_include():
     responses.add(responses.GET, "{}/items".format(host), json={
@@ -176,3 +249,21 @@ def test_include():
     item1, item2 = Item.list()
     assert item1.tag.name == "tag1"
     assert item2.tag.name == "tag2"
+
+
+@responses.activate
+def test_include_shared():
+    responses.add(responses.GET, "{}/items".format(host), json={
+        'data': [{'type': "items",
+                  'id': str(i),
+                  'relationships': {'tag': {'data': {'type': "tags",
+                                                     'id': "1"}}}}
+                 for i in range(1, 4)],
+        'included': [{'type': "tags",
+                      'id': "1",
+                      'attributes': {'name': "tag1"}}],
+    })
+
+    item1, item2, item3 = Item.list()
+    assert item1.tag.name == "tag1"
+    assert item1.tag is item2.tag is item3.tag
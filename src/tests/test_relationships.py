@@ -1,14 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
 import json
-from copy import deepcopy
 
 import responses
 
 import jsonapi
 
 from .constants import host
-from .payloads import Payloads
+from .payloads import Payloads, copy_payload
 
 _api = jsonapi.JsonApi(host=host, auth="test_api_key")
 
@@ -87,6 +86,81 @@ def test_singular_fetch():
     assert child.parent.name == "parent 1"
 
 
+@responses.activate
+def test_fetch_many_singular():
+    responses.add(responses.GET,
+                  "{}/children/1?include=parent,guardian".format(host),
+                  json={'data': child_payloads[1],
+                        'included': parent_payloads[1:3]},
+                  match_querystring=True)
+
+    child = Child(id="1", relationships={'parent': Parent(id="1"),
+                                         'guardian': Parent(id="2")})
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 1
+    assert child.parent.name == "parent 1"
+    assert child.guardian.name == "parent 2"
+
+
+@responses.activate
+def test_fetch_many_singular_same_item():
+    responses.add(responses.GET,
+                  "{}/children/1?include=parent,guardian".format(host),
+                  json={'data': child_payloads[1],
+                        'included': parent_payloads[1:2]},
+                  match_querystring=True)
+
+    child = Child(id="1", relationships={'parent': Parent(id="1"),
+                                         'guardian': Parent(id="1")})
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 1
+    assert child.parent.name == child.guardian.name == "parent 1"
+    assert child.parent.attributes is not child.guardian.attributes
+    child.parent.name = "changed"
+    assert child.guardian.name == "parent 1"
+
+
+@responses.activate
+def test_fetch_many_singular_without_include_support():
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  json={'errors': [{'status': "400",
+                                    'code': "invalid_include",
+                                    'title': "Invalid include",
+                                    'detail': "Invalid include"}]},
+                  status=400)
+    for i in (1, 2):
+        responses.add(responses.GET, "{}/parents/{}".format(host, i),
+                      json={'data': parent_payloads[i]})
+
+    child = Child(id="1", relationships={'parent': Parent(id="1"),
+                                         'guardian': Parent(id="2")})
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 3
+    assert child.parent.name == "parent 1"
+    assert child.guardian.name == "parent 2"
+
+
+@responses.activate
+def test_fetch_many_singular_with_non_json_api_error():
+    responses.add(responses.GET, "{}/children/1".format(host),
+                  body="<html>bad include</html>", status=400,
+                  content_type="text/html")
+    for i in (1, 2):
+        responses.add(responses.GET, "{}/parents/{}".format(host, i),
+                      json={'data': parent_payloads[i]})
+
+    child = Child(id="1", relationships={'parent': Parent(id="1"),
+                                         'guardian': Parent(id="2")})
+    child.fetch('parent', 'guardian')
+
+    assert len(responses.calls) == 3
+    assert child.parent.name == "parent 1"
+    assert child.guardian.name == "parent 2"
+
+
 @responses.activate
 def test_fetch_plural():
     responses.add(responses.GET, "{}/parents/1/children".format(host),
@@ -117,7 +191,7 @@ def test_fetch_plural():
 
 @responses.activate
 def test_change_parent_with_save():
-    response_body = deepcopy(child_payloads[1])
+    response_body = copy_payload(child_payloads[1])
     relationship = response_body['relationships']['parent']
     relationship['data']['id'] = 2
     relationship['links']['related'] = relationship['links']['related'].\
@@ -160,6 +234,32 @@ def test_change_parent_with_change():
             new_parent.as_relationship())
 
 
+@responses.activate
+def test_change_parent_to_and_from_null():
+    responses.add(responses.PATCH,
+                  "{}/children/1/relationships/parent".format(host))
+
+    child = Child(child_payloads[1])
+    child.change('parent', None)
+
+    assert child.relationships['parent']['data'] is None
+    assert child.parent is None
+
+    child = Child(id="1", relationships={'parent': None})
+    child.change('parent', Parent(id="2"))
+
+    assert child.relationships['parent'] == {'data': {'type': "parents",
+                                                      'id': "2"}}
+    assert child.parent.id == "2"
+
+    assert len(responses.calls) == 2
+    assert json.loads(responses.calls[0].request.body.decode()) == {
+        'data': None,
+    }
+    assert (json.loads(responses.calls[1].request.body.decode()) ==
+            Parent(id="2").as_relationship())
+
+
 @responses.activate
 def test_add():
     responses.add(responses.POST,
@@ -1,13 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
 import json
-from copy import deepcopy
 
 import responses
 
 import jsonapi
 
 from .constants import host
+from .payloads import copy_payload
 
 _api = jsonapi.JsonApi(host=host, auth="test_api_key")
 
@@ -41,6 +41,17 @@ def test_init():
     make_simple_assertions(foo)
 
 
+def test_init_copies_payload():
+    foo = Foo(SIMPLE_PAYLOAD)
+    foo.attributes['hello'] = "WORLD"
+    assert SIMPLE_PAYLOAD['attributes'] == {'hello': "world"}
+
+    attributes = {'hello': "world"}
+    foo = Foo(attributes=attributes, goodbye="world")
+    assert foo.attributes == {'hello': "world", 'goodbye': "world"}
+    assert attributes == {'hello': "world"}
+
+
 def test_new():
     foo = _api.new(type="foos", id="1", attributes={'hello': "world"})
     make_simple_assertions(foo)
@@ -74,7 +85,7 @@ def test_setattr():
 def test_reload():
     foo = Foo(SIMPLE_PAYLOAD)
 
-    new_payload = deepcopy(SIMPLE_PAYLOAD)
+    new_payload = copy_payload(SIMPLE_PAYLOAD)
     new_payload['attributes']['hello'] = "WORLD"
     responses.add(responses.GET, "{}/foos/1".format(host),
                   json={'data': new_payload})
@@ -99,6 +110,67 @@ def test_get_one():
     make_simple_assertions(foo)
 
 
+@responses.activate
+def test_get_one_not_modified():
+    def callback(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return 304, {}, ""
+        return 200, {'ETag': '"v1"'}, json.dumps({'data': SIMPLE_PAYLOAD})
+
+    responses.add_callback(responses.GET, "{}/foos/1".format(host),
+                           callback=callback)
+
+    first = Foo.get('1')
+    first.attributes['hello'] = "WORLD"
+    second = Foo.get('1')
+    # Different credentials don't get to reuse the body
+    _api.setup(auth="another_key")
+    Foo.get('1')
+    _api.setup(auth="test_api_key")
+    _api._conditional_cache.clear()
+
+    assert len(responses.calls) == 3
+    assert 'If-None-Match' not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+    assert responses.calls[1].response.status_code == 304
+    assert 'If-None-Match' not in responses.calls[2].request.headers
+
+    make_simple_assertions(second)
+
+
+@responses.activate
+def test_conditional_cache_eviction():
+    def callback(request):
+        etag = '"{}"'.format(request.url)
+        if request.headers.get('If-None-Match') == etag:
+            return 304, {}, ""
+        return 200, {'ETag': etag}, json.dumps({'data': SIMPLE_PAYLOAD})
+
+    for id in ("1", "2", "3"):
+        responses.add_callback(responses.GET,
+                               "{}/foos/{}".format(host, id),
+                               callback=callback)
+
+    api = jsonapi.JsonApi(host=host, auth="test_api_key")
+    api.CONDITIONAL_CACHE_SIZE = 2
+    for id in ("1", "2", "1", "3"):
+        api.request('get', "/foos/{}".format(id), conditional=True)
+
+    assert responses.calls[2].response.status_code == 304
+    # "1" was used more recently than "2"
+    assert ([url for url, _ in api._conditional_cache] ==
+            ["{}/foos/1".format(host), "{}/foos/3".format(host)])
+
+
+@responses.activate
+def test_collections_not_kept_for_conditional_requests():
+    responses.add(responses.GET, "{}/foos".format(host),
+                  json={'data': [SIMPLE_PAYLOAD]}, headers={'ETag': '"v1"'})
+
+    assert list(Foo.list()) == [Foo(id="1")]
+    assert not _api._conditional_cache
+
+
 @responses.activate
 def test_get_one_with_filters():
     responses.add(responses.GET, "{}/foos?filter[hello]=world".format(host),
@@ -152,7 +224,7 @@ def test_get_one_with_include():
 def test_save_existing():
     foo = Foo(SIMPLE_PAYLOAD)
 
-    new_payload = deepcopy(SIMPLE_PAYLOAD)
+    new_payload = copy_payload(SIMPLE_PAYLOAD)
     new_payload['attributes']['hello'] = "WORLD"
     responses.add(responses.PATCH, "{}/foos/1".format(host),
                   json={'data': new_payload})
@@ -174,7 +246,7 @@ def test_save_existing():
 
 @responses.activate
 def test_save_new():
-    new_payload = deepcopy(SIMPLE_PAYLOAD)
+    new_payload = copy_payload(SIMPLE_PAYLOAD)
     new_payload['attributes']['created'] = "NOW!!!"
     responses.add(responses.POST, "{}/foos".format(host),
                   json={'data': new_payload})
@@ -189,7 +261,7 @@ def test_save_new():
 
 @responses.activate
 def test_create():
-    new_payload = deepcopy(SIMPLE_PAYLOAD)
+    new_payload = copy_payload(SIMPLE_PAYLOAD)
     new_payload['attributes']['created'] = "NOW!!!"
     responses.add(responses.POST, "{}/foos".format(host),
                   json={'data': new_payload})
@@ -202,7 +274,7 @@ def test_create():
 
 @responses.activate
 def test_create_with_id():
-    new_payload = deepcopy(SIMPLE_PAYLOAD)
+    new_payload = copy_payload(SIMPLE_PAYLOAD)
     new_payload['attributes']['created'] = "NOW!!!"
     responses.add(responses.POST, "{}/foos".format(host),
                   json={'data': new_payload})
@@ -239,6 +311,31 @@ def test_eq():
     assert {'data': {'type': "foos", 'id': "1"}} == foo
     assert foo == Foo(id="1")
     assert Foo(id="1") == foo
+    assert foo != Foo(id="2")
+    assert foo != {'type': "bars", 'id': "1"}
+    assert foo != "1"
+    assert foo != {'data': None}
+    assert not foo == {'data': None}
+
+
+def test_hash():
+    assert len({Foo(id="1"), Foo(SIMPLE_PAYLOAD), Foo(id="2")}) == 2
+
+    # Unsaved instances are not hashable, so distinct ones can't be merged in
+    # a set and a saved one can't get lost in it
+    for value in (Foo(), Foo(attributes={'hello': "world"})):
+        try:
+            hash(value)
+        except TypeError:
+            pass
+        else:
+            assert False, "Unsaved instance is hashable"
+    try:
+        set([Foo(), Foo()])
+    except TypeError:
+        pass
+    else:
+        assert False, "Unsaved instances were put in a set"
 
 
 def test_as_resource_identifier():
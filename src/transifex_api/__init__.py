@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import jsonapi
 
@@ -11,6 +12,17 @@ def setup(auth, host=None, headers=None):
     _api.setup(host=host, auth=auth, headers=headers)
 
 
+def _poll_delays(interval):
+    """ Delays to wait between polls of an async job; start small so that
+        quick jobs return fast and double up to `interval`.
+    """
+
+    delay = 0.25
+    while True:
+        yield min(delay, interval)
+        delay *= 2
+
+
 @_api.register
 class Organization(jsonapi.Resource):
     TYPE = "organizations"
@@ -36,13 +48,26 @@ class Resource(jsonapi.Resource):
     TYPE = "resources"
 
     def purge(self):
-        count = 0
         # Instead of filter, if Resource had a plural relationship to
-        # ResourceString, we could do `self.fetch('resource_strings')`
-        for page in list(ResourceString.filter(resource=self).all_pages()):
-            count += len(page)
-            ResourceString.bulk_delete(page)
-        return count
+        # ResourceString, we could do `self.fetch('resource_strings')`.
+        # `all_pages` only yields a page after it has been fetched, so a page
+        # is deleted only once the page after it (and with it the cursor
+        # past the deleted items) has been received. The deletions are
+        # independent of each other, so they run while the following pages
+        # are being fetched
+        pages = ResourceString.filter(resource=self).all_pages()
+        futures = []
+        previous_page = None
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for page in pages:
+                if previous_page is not None:
+                    futures.append(executor.submit(ResourceString.bulk_delete,
+                                                   previous_page))
+                previous_page = page
+            if previous_page is not None:
+                futures.append(executor.submit(ResourceString.bulk_delete,
+                                               previous_page))
+        return sum(future.result() for future in futures)
 
 
 @_api.register
@@ -66,8 +91,8 @@ class ResourceStringsAsyncUpload(jsonapi.Resource):
 
             :param resource: A (transifex) Resource instance or ID
             :param content: A string or file-like object
-            :param interval: How often (in seconds) to poll for the completion
-                             of the upload job
+            :param interval: The maximum time (in seconds) to wait between
+                             polls for the completion of the upload job
         """
 
         if isinstance(resource, Resource):
@@ -76,6 +101,7 @@ class ResourceStringsAsyncUpload(jsonapi.Resource):
         upload = cls.create_with_form(data={'resource': resource},
                                       files={'content': content})
 
+        delays = _poll_delays(interval)
         while True:
             if hasattr(upload, 'errors') and len(upload.errors) > 0:
                 errors = [{
@@ -86,7 +112,7 @@ class ResourceStringsAsyncUpload(jsonapi.Resource):
                 raise JsonApiException(409, errors)
             if upload.redirect:
                 return upload.follow()
-            time.sleep(interval)
+            time.sleep(next(delays))
             upload.reload()
 
 
@@ -102,8 +128,8 @@ class ResourceTranslationsAsyncUpload(Resource):
             :param resource: A (transifex) Resource instance or ID
             :param content: A string or file-like object
             :param language: A (transifex) Language instance or ID
-            :param interval: How often (in seconds) to poll for the completion
-                             of the upload job
+            :param interval: The maximum time (in seconds) to wait between
+                             polls for the completion of the upload job
             :param file_type: The content file type
         """
 
@@ -115,6 +141,7 @@ class ResourceTranslationsAsyncUpload(Resource):
                                             'file_type': file_type},
                                       files={'content': content})
 
+        delays = _poll_delays(interval)
         while True:
             if hasattr(upload, 'errors') and len(upload.errors) > 0:
                 errors = [{
@@ -125,7 +152,7 @@ class ResourceTranslationsAsyncUpload(Resource):
                 raise JsonApiException(409, errors)
             if upload.redirect:
                 return upload.follow()
-            time.sleep(interval)
+            time.sleep(next(delays))
             upload.reload()
 
 
@@ -151,6 +178,7 @@ class ResourceTranslationsAsyncDownload(jsonapi.Resource):
     @classmethod
     def download(cls, interval=5, *args, **kwargs):
         download = cls.create(*args, **kwargs)
+        delays = _poll_delays(interval)
         while True:
             if hasattr(download, 'errors') and len(download.errors) > 0:
                 errors = [{'code': e['code'],
@@ -161,5 +189,5 @@ class ResourceTranslationsAsyncDownload(jsonapi.Resource):
                 raise JsonApiException(409, errors)
             if download.redirect:
                 return download.redirect
-            time.sleep(interval)
+            time.sleep(next(delays))
             download.reload()